@@ -1,10 +1,14 @@
 """Configuration for the Takaichi RAG system."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
-from raglite import RAGLiteConfig
-from rerankers import Reranker
+
+if TYPE_CHECKING:
+    # Imported for annotations only; raglite is loaded lazily in get_default_config
+    from raglite import RAGLiteConfig
 
 # Load environment variables
 load_dotenv()
@@ -27,19 +31,69 @@ if not OPENAI_API_KEY:
 # Set OpenAI API key in environment for LiteLLM
 os.environ["OPENAI_API_KEY"] = OPENAI_API_KEY
 
+# Database URL (local DuckDB by default; PostgreSQL is also supported by RAGLite)
+DB_URL = os.getenv("DB_URL", "duckdb:///raglite.db")
+
+
 # RAGLite configuration with Japanese language support
-DEFAULT_RAG_CONFIG = RAGLiteConfig(
-    # Database configuration (using local DuckDB)
-    db_url=os.getenv("DB_URL", "duckdb:///raglite.db"),
+@lru_cache(maxsize=2)
+def get_default_config(with_reranker: bool = True) -> "RAGLiteConfig":
+    """
+    Build the RAGLite configuration with Japanese language support.
+
+    The configuration (and the reranker model it carries) is only created on
+    first use, so commands that never query (e.g. --scrape, --index) do not pay
+    for loading the FlashRank model. Every caller, the CLI included, gets a
+    database tuned by configure_database, applied once per configuration.
+
+    Args:
+        with_reranker: Attach the multilingual reranker (only needed for querying)
+
+    Returns:
+        Cached RAGLiteConfig object
+    """
+    from raglite import RAGLiteConfig
+    from rag.setup import configure_database, get_http_client, get_reranker
+
+    # Reuse pooled connections for all OpenAI calls
+    get_http_client()
+
+    config = RAGLiteConfig(
+        # Database configuration (using local DuckDB)
+        db_url=DB_URL,
+
+        # OpenAI models (with Japanese support)
+        llm=os.getenv("LLM_MODEL", "gpt-4o-mini"),
+        embedder=os.getenv("EMBEDDING_MODEL", "text-embedding-3-large"),
+
+        # Reranker configuration for Japanese
+        # Using ms-marco-MultiBERT-L-12 for multilingual support (100+ languages including Japanese)
+        reranker=get_reranker() if with_reranker else None
+    )
 
-    # OpenAI models (with Japanese support)
-    llm=os.getenv("LLM_MODEL", "gpt-4o-mini"),
-    embedder=os.getenv("EMBEDDING_MODEL", "text-embedding-3-large"),
+    # DuckDB threads, memory limit and HNSW search width
+    configure_database(config)
+
+    return config
+
+
+def __getattr__(name: str):
+    """Resolve DEFAULT_RAG_CONFIG lazily for backward compatibility."""
+    if name == "DEFAULT_RAG_CONFIG":
+        return get_default_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _env_flag(name: str, default: str = "false") -> bool:
+    """Read a boolean flag (1/true/yes/on) from the environment."""
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+# Retrieval tuning, adjustable through the environment without code changes
+RAG_TOP_K = int(os.getenv("RAG_TOP_K", "5"))                 # Chunks retrieved per question
+RAG_RERANK_ENABLED = _env_flag("RAG_RERANK_ENABLED")         # Rerank fused results with FlashRank
+RAG_SSE_METRICS = _env_flag("RAG_SSE_METRICS")               # Send per-request timings as an SSE event
 
-    # Reranker configuration for Japanese
-    # Using ms-marco-MultiBERT-L-12 for multilingual support (100+ languages including Japanese)
-    reranker=Reranker("ms-marco-MultiBERT-L-12", model_type="flashrank", verbose=0)
-)
 
 # Scraper configuration
 SCRAPER_CONFIG = {
@@ -59,4 +113,15 @@ SCRAPER_CONFIG = {
     },
     "timeout": 30,
     "delay_between_requests": 1.0,  # Be polite to the server
-}
\ No newline at end of file
+    "concurrency": 4,               # Maximum requests in flight
+    "max_retries": 3,               # Attempts per page for network errors, 429 and 5xx
+    "retry_backoff": 1.0,           # Base seconds for exponential backoff between attempts
+    "max_page_bytes": 2_000_000,    # Skip pages larger than this
+}
+
+# Absolute URLs of the target pages as (category, url) pairs, resolved once at import
+SCRAPER_TARGETS = [
+    (category, f"{SCRAPER_CONFIG['base_url']}/{page_path}")
+    for category, page_path in SCRAPER_CONFIG["target_pages"].items()
+]
+
@@ -19,9 +19,11 @@ load_dotenv()
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import DEFAULT_RAG_CONFIG, SCRAPER_CONFIG, RAW_DATA_DIR, PROCESSED_DATA_DIR
+from config import (
+    get_default_config, SCRAPER_CONFIG, SCRAPER_TARGETS, RAW_DATA_DIR, PROCESSED_DATA_DIR
+)
 from scraper import WebCrawler
-from rag import setup_raglite, DocumentIndexer, QueryEngine
+import rag  # Lazily loads RAGLite on first attribute access (keeps --scrape startup light)
 
 
 def scrape_website(output_file: Optional[Path] = None) -> Path:
@@ -41,8 +43,8 @@ def scrape_website(output_file: Optional[Path] = None) -> Path:
     # Initialize crawler
     crawler = WebCrawler(SCRAPER_CONFIG, RAW_DATA_DIR)
 
-    # Crawl all pages
-    scraped_data = crawler.crawl_all_pages()
+    # Crawl all pages (fetched concurrently over one shared HTTP client)
+    scraped_data = crawler.crawl_all_pages(SCRAPER_TARGETS)
 
     # Save data
     output_path = crawler.save_data(output_file)
@@ -54,12 +56,13 @@ def scrape_website(output_file: Optional[Path] = None) -> Path:
     return output_path
 
 
-def index_documents(json_file: Path) -> int:
+def index_documents(json_file: Path, config=None) -> int:
     """
     Index scraped documents into RAGLite.
 
     Args:
-        json_file: Path to JSON file containing scraped data
+        json_file: Path to the scraped data file (.jsonl)
+        config: Optional preloaded RAGLite configuration
 
     Returns:
         Number of documents indexed
@@ -68,11 +71,12 @@ def index_documents(json_file: Path) -> int:
     print("ドキュメントインデックス作成開始")
     print("=" * 50)
 
-    # Setup RAGLite with Japanese configuration
-    config = DEFAULT_RAG_CONFIG
+    # Setup RAGLite with Japanese configuration (indexing does not need the reranker)
+    if config is None:
+        config = get_default_config(with_reranker=False)
 
     # Initialize indexer
-    indexer = DocumentIndexer(config)
+    indexer = rag.DocumentIndexer(config)
 
     # Index documents
     num_docs = indexer.index_json_file(json_file)
@@ -83,36 +87,42 @@ def index_documents(json_file: Path) -> int:
     return num_docs
 
 
-def run_interactive_query():
+def run_interactive_query(config=None):
     """
     Run interactive query session.
+
+    Args:
+        config: Optional preloaded RAGLite configuration
     """
     print("\n" + "=" * 50)
     print("高市早苗RAGシステム - インタラクティブモード")
     print("=" * 50)
 
     # Setup RAGLite
-    config = DEFAULT_RAG_CONFIG
+    if config is None:
+        config = get_default_config()
 
     # Initialize query engine
-    query_engine = QueryEngine(config)
+    query_engine = rag.QueryEngine(config)
 
     # Run interactive session
     query_engine.interactive_query()
 
 
-def test_query(question: str):
+def test_query(question: str, config=None):
     """
     Test a single query.
 
     Args:
         question: The question to test
+        config: Optional preloaded RAGLite configuration
     """
     # Setup RAGLite
-    config = DEFAULT_RAG_CONFIG
+    if config is None:
+        config = get_default_config()
 
     # Initialize query engine
-    query_engine = QueryEngine(config)
+    query_engine = rag.QueryEngine(config)
 
     print(f"\n質問: {question}")
     print("\n回答を生成中...\n")
@@ -137,7 +147,7 @@ def main():
   python main.py --scrape
 
   # 既存のJSONファイルからインデックス作成
-  python main.py --index data/raw/scraped_data.json
+  python main.py --index data/raw/column_<timestamp>.jsonl
 
   # 対話モードを開始（CLI）
   python main.py --chat
@@ -194,6 +204,12 @@ def main():
         default=8000,
         help='Webサーバーのポート番号（デフォルト: 8000）'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Webサーバーのワーカープロセス数（PostgreSQL使用時のみ2以上が有効、デフォルト: 1）'
+    )
 
     args = parser.parse_args()
 
@@ -207,9 +223,11 @@ def main():
 
         # Execute all steps
         if args.all:
+            # Load the configuration once and reuse it across the pipeline
+            config = get_default_config()
             json_file = scrape_website()
-            index_documents(json_file)
-            run_interactive_query()
+            index_documents(json_file, config=config)
+            run_interactive_query(config=config)
 
         # Execute individual steps
         else:
@@ -231,7 +249,7 @@ def main():
 
             if args.web:
                 from web_api import run_server
-                run_server(host=args.host, port=args.port)
+                run_server(host=args.host, port=args.port, workers=args.workers)
 
     except KeyboardInterrupt:
         print("\n\n処理を中断しました。")
@@ -1,7 +1,23 @@
 """RAG module for indexing and querying documents."""
 
-from .setup import setup_raglite
-from .indexer import DocumentIndexer
-from .query import QueryEngine
+import importlib
 
-__all__ = ['setup_raglite', 'DocumentIndexer', 'QueryEngine']
\ No newline at end of file
+# Submodules are imported on first attribute access (PEP 562) so that importing
+# the package does not pull in raglite, rerankers and litellm up front.
+_LAZY_ATTRIBUTES = {
+    'setup_raglite': '.setup',
+    'DocumentIndexer': '.indexer',
+    'QueryEngine': '.query',
+    'SemanticCache': '.cache',
+    'CATEGORY_LABELS': '.constants',
+}
+
+__all__ = ['setup_raglite', 'DocumentIndexer', 'QueryEngine', 'SemanticCache', 'CATEGORY_LABELS']
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,94 @@
+"""Semantic cache for answers to previously asked questions."""
+
+import threading
+from typing import Any, List, Optional
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Cache answers by question embedding, matching paraphrases by cosine similarity.
+
+    Embeddings are stored as unit-norm float32 rows of one matrix (about
+    25 MB for 2048 entries of 3072 dimensions), so a lookup is a single
+    BLAS matrix-vector product with no conversion. The matrix is allocated
+    once at full size and used as a ring buffer: once the cache is full,
+    each new entry overwrites the oldest one in place (first in, first out).
+    """
+
+    def __init__(self, threshold: float = 0.88, maxsize: int = 2048):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            maxsize: Maximum number of cached entries
+        """
+        self.threshold = threshold
+        self.maxsize = maxsize
+        # Allocated on the first put, once the embedding dimension is known
+        self._vectors: Optional[np.ndarray] = None
+        self._values: List[Any] = [None] * maxsize
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return self._size
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        """Return the embedding as a unit-norm float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def get(self, embedding: np.ndarray) -> Optional[Any]:
+        """
+        Look up the value stored for the most similar cached question.
+
+        Args:
+            embedding: Question embedding
+
+        Returns:
+            The cached value, or None if no entry reaches the threshold
+        """
+        query = self._normalize(embedding)
+        with self._lock:
+            if not self._size:
+                return None
+            # Only the filled rows of the ring are scored
+            scores = self._vectors[:self._size] @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            return self._values[best]
+
+    def put(self, embedding: np.ndarray, value: Any):
+        """
+        Store a value for a question embedding.
+
+        Args:
+            embedding: Question embedding
+            value: Value to return for similar questions (e.g. answer and sources)
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.maxsize, vector.size), dtype=np.float32)
+
+            # Write into the next slot, overwriting the oldest entry once full
+            slot = self._next
+            self._vectors[slot] = vector
+            self._values[slot] = value
+            self._next = (slot + 1) % self.maxsize
+            self._size = min(self._size + 1, self.maxsize)
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._vectors = None
+            self._values = [None] * self.maxsize
+            self._size = 0
+            self._next = 0
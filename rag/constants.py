@@ -0,0 +1,17 @@
+"""Shared constants for the RAG module."""
+
+from types import MappingProxyType
+
+# Category labels in Japanese
+CATEGORY_LABELS = MappingProxyType({
+    'idea': '基本理念',
+    'posture': '政治姿勢',
+    'results': '実績',
+    'kaiken': '記者会見',
+    'column': 'コラム',
+})
+
+# Precomputed document content prefixes, e.g. "[基本理念]\n"
+CATEGORY_PREFIXES = MappingProxyType({
+    category: f"[{label}]\n" for category, label in CATEGORY_LABELS.items()
+})
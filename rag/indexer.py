@@ -1,23 +1,86 @@
 """Document indexer for RAGLite."""
 
+import hashlib
 import json
+import os
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 from tqdm import tqdm
-from raglite import Document, insert_documents, RAGLiteConfig
+from raglite import Document, delete_documents, insert_documents, RAGLiteConfig
+from raglite._database import create_database_engine
+from sqlmodel import Session, col, select
+from .constants import CATEGORY_PREFIXES
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def iter_scraped_data(json_path: Path) -> Iterator[Dict]:
+    """
+    Iterate over scraped pages in a crawler output file.
+
+    JSON Lines files are read one line at a time, so only the current page
+    is held in memory.
+
+    Args:
+        json_path: Path to a JSON Lines (.jsonl) file, or a JSON array file
+
+    Yields:
+        Scraped data dictionaries
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    json_path = Path(json_path)
+
+    if json_path.suffix == '.jsonl':
+        # One page per line; parse the raw UTF-8 bytes without an intermediate str
+        with open(json_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+        return
+
+    yield from loads(json_path.read_bytes())
+
+
+def load_scraped_data(json_path: Path) -> List[Dict]:
+    """
+    Load scraped pages from a crawler output file.
+
+    Args:
+        json_path: Path to a JSON Lines (.jsonl) file, or a JSON array file
+
+    Returns:
+        List of scraped data dictionaries
+    """
+    return list(iter_scraped_data(json_path))
 
 
 class DocumentIndexer:
     """Indexer for processing and storing documents in RAGLite."""
 
-    def __init__(self, config: RAGLiteConfig):
+    def __init__(
+        self,
+        config: RAGLiteConfig,
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ):
         """
         Initialize the document indexer.
 
         Args:
             config: RAGLite configuration
+            batch_size: Number of documents per insert transaction
+                        (default: all documents in one transaction)
+            max_workers: Worker threads RAGLite uses to chunk and embed documents
+                         in parallel (default: CPU count)
         """
         self.config = config
+        self.batch_size = batch_size
+        # RAGLite caps its own default at 4 threads; embedding requests are
+        # I/O bound, so keep one in flight per core
+        self.max_workers = max_workers or os.cpu_count() or 1
 
     def index_scraped_data(self, scraped_data: List[Dict]) -> int:
         """
@@ -30,18 +93,50 @@ class DocumentIndexer:
             Number of documents indexed
         """
         documents = []
+        duplicates = 0
+        # Digests of the whitespace-normalized content of pages in this call, to
+        # drop pages scraped under several URLs; earlier runs are handled below
+        seen_digests = set()
 
         print(f"Processing {len(scraped_data)} scraped pages...")
 
-        for data in tqdm(scraped_data, desc="Creating documents"):
-            # Create document from scraped data
-            doc = self._create_document_from_scraped(data)
-            if doc:
-                documents.append(doc)
+        # Create documents from scraped data, dropping pages with insufficient content
+        created = [
+            doc for doc in (
+                self._create_document_from_scraped(data)
+                for data in tqdm(scraped_data, desc="Creating documents", mininterval=0.5)
+            )
+            if doc is not None
+        ]
+
+        for doc in created:
+            # Skip pages whose full content was already seen under another URL
+            digest = hashlib.blake2b(
+                ' '.join(doc.content.split()).encode('utf-8'), digest_size=16
+            ).digest()
+            if digest in seen_digests:
+                duplicates += 1
+                continue
+            seen_digests.add(digest)
+            documents.append(doc)
+
+        if duplicates:
+            print(f"Skipping {duplicates} duplicate pages.")
+
+        # Document ids are content hashes, so pages indexed by a previous run with
+        # the same content need no embedding work; changed pages replace their old version
+        indexed_ids, stale_ids = self._find_indexed_documents(documents)
+        if indexed_ids:
+            documents = [doc for doc in documents if doc.id not in indexed_ids]
+            print(f"Skipping {len(indexed_ids)} unchanged pages.")
 
         if documents:
             print(f"Indexing {len(documents)} documents...")
-            insert_documents(documents, config=self.config)
+            self._insert_documents(documents)
+            if stale_ids:
+                # Remove the previous versions only once the new ones are stored
+                delete_documents(sorted(stale_ids), config=self.config)
+                print(f"Replaced {len(stale_ids)} outdated page versions.")
             print(f"Successfully indexed {len(documents)} documents.")
         else:
             print("No documents to index.")
@@ -50,18 +145,16 @@ class DocumentIndexer:
 
     def index_json_file(self, json_path: Path) -> int:
         """
-        Index documents from a JSON file.
+        Index documents from a scraped data file.
 
         Args:
-            json_path: Path to the JSON file containing scraped data
+            json_path: Path to the JSON Lines (.jsonl) file written by the
+                       crawler, or a JSON array file from older crawls
 
         Returns:
             Number of documents indexed
         """
-        with open(json_path, 'r', encoding='utf-8') as f:
-            scraped_data = json.load(f)
-
-        return self.index_scraped_data(scraped_data)
+        return self.index_scraped_data(load_scraped_data(json_path))
 
     def _create_document_from_scraped(self, data: Dict) -> Optional[Document]:
         """
@@ -114,23 +207,11 @@ class DocumentIndexer:
         Returns:
             Formatted content string
         """
-        parts = []
-
-        # Add category only (provides search context, stored in metadata too)
-        category_labels = {
-            'idea': '基本理念',
-            'posture': '政治姿勢',
-            'results': '実績',
-            'kaiken': '記者会見',
-            'column': 'コラム',
-        }
-        category = category_labels.get(data.get('category', ''), data.get('category', ''))
-        parts.append(f"[{category}]")
-
-        # Add main content
-        parts.append(data['content'])
+        # Prefix category only (provides search context, stored in metadata too)
+        category = data.get('category', '')
+        prefix = CATEGORY_PREFIXES.get(category) or f"[{category}]\n"
 
-        return "\n".join(parts)
+        return prefix + data['content']
 
     def add_single_document(self, text: str, metadata: Dict = None) -> bool:
         """
@@ -148,7 +229,7 @@ class DocumentIndexer:
                 content=text,  # Use 'content' field instead of 'text'
                 metadata=metadata or {}
             )
-            insert_documents([doc], config=self.config)
+            self._insert_documents([doc])
             return True
         except Exception as e:
             print(f"Error adding document: {e}")
@@ -164,18 +245,63 @@ class DocumentIndexer:
         Returns:
             Number of documents added
         """
-        docs = []
-        for doc_data in documents:
-            # Support both 'text' and 'content' field names for backward compatibility
-            content = doc_data.get('content') or doc_data.get('text')
-            if content:
-                doc = Document(
-                    content=content,  # Use 'content' field
-                    metadata=doc_data.get('metadata', {})
-                )
-                docs.append(doc)
+        # Support both 'text' and 'content' field names for backward compatibility
+        docs = [
+            Document(content=content, metadata=metadata)  # Use 'content' field
+            for content, metadata in (
+                (doc_data.get('content') or doc_data.get('text'), doc_data.get('metadata', {}))
+                for doc_data in documents
+            )
+            if content
+        ]
 
         if docs:
-            insert_documents(docs, config=self.config)
+            self._insert_documents(docs)
+
+        return len(docs)
+
+    def _find_indexed_documents(self, documents: List[Document]) -> Tuple[Set[str], Set[str]]:
+        """
+        Look up previously indexed versions of the given pages by URL.
+
+        Args:
+            documents: Documents about to be indexed
+
+        Returns:
+            Tuple of (ids of documents already indexed with identical content,
+            ids of older versions of the same URLs whose content has changed)
+        """
+        urls = {doc.url for doc in documents if doc.url}
+        if not urls:
+            return set(), set()
+
+        new_ids = {doc.id for doc in documents}
+        with Session(create_database_engine(self.config)) as session:
+            rows = session.exec(
+                select(Document.id, Document.url).where(col(Document.url).in_(urls))
+            ).all()
+
+        indexed_ids = {doc_id for doc_id, _ in rows if doc_id in new_ids}
+        stale_ids = {doc_id for doc_id, _ in rows if doc_id not in new_ids}
+        return indexed_ids, stale_ids
+
+    def _insert_documents(self, documents: List[Document]):
+        """
+        Insert documents into RAGLite.
+
+        RAGLite embeds all chunks of a document in batched API calls and flushes
+        rows as they arrive, but rebuilds the full-text index, compacts the HNSW
+        index and checkpoints once per call. Inserting everything in a single
+        call (one transaction) pays for that only once; batch_size can split
+        very large imports into several transactions.
 
-        return len(docs)
\ No newline at end of file
+        Args:
+            documents: Documents to insert
+        """
+        batch_size = self.batch_size or max(len(documents), 1)
+        for start in range(0, len(documents), batch_size):
+            insert_documents(
+                documents[start:start + batch_size],
+                max_workers=self.max_workers,
+                config=self.config
+            )
\ No newline at end of file
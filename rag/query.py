@@ -1,20 +1,144 @@
 """Query engine for RAGLite."""
 
-from typing import Dict
-from raglite import rag, RAGLiteConfig, retrieve_context, add_context
+import asyncio
+import sys
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import numpy as np
+from raglite import (
+    rag, async_rag, RAGLiteConfig, add_context,
+    vector_search, keyword_search, rerank_chunks, retrieve_chunk_spans
+)
+from raglite._search import reciprocal_rank_fusion
+from raglite._embed import embed_strings
+from .constants import CATEGORY_LABELS
+
+
+def normalize_question(question: str) -> str:
+    """
+    Normalize a question so trivially different spellings share cache entries.
+
+    Applies NFKC (full-width/half-width forms), collapses whitespace and casefolds.
+
+    Args:
+        question: The raw question
+
+    Returns:
+        Normalized question
+    """
+    return " ".join(unicodedata.normalize("NFKC", question).split()).casefold()
+
+
+# Hybrid search settings, matching RAGLite's hybrid_search defaults
+HYBRID_OVERSAMPLE = 2
+HYBRID_WEIGHTS = (0.75, 0.25)  # (vector, keyword)
+
+# Embedding API calls in flight at once for async callers
+EMBED_WORKERS = 4
+
+
+@lru_cache(maxsize=1024)
+def _embed_cached(question: str, config: RAGLiteConfig) -> np.ndarray:
+    """
+    Embed a normalized question, caching the result.
+
+    Args:
+        question: Normalized question
+        config: RAGLite configuration (selects the embedder)
+
+    Returns:
+        The question embedding
+    """
+    embedding = embed_strings([question], config=config)[0, :]
+    # Shared between callers, so guard against accidental in-place changes
+    embedding.flags.writeable = False
+    return embedding
+
+
+class TokenBuffer:
+    """Buffer streamed tokens and write them to stdout in batches."""
+
+    def __init__(self, max_tokens: int = 16, max_delay: float = 0.05):
+        """
+        Initialize the token buffer.
+
+        Args:
+            max_tokens: Flush once this many tokens are buffered
+            max_delay: Flush once this many seconds passed since the last flush
+        """
+        self.max_tokens = max_tokens
+        self.max_delay = max_delay
+        self._buffer = []
+        self._last_flush = time.monotonic()
+
+    def write(self, token: str):
+        """Add a token, flushing if the buffer is full or stale."""
+        self._buffer.append(token)
+        if (len(self._buffer) >= self.max_tokens
+                or time.monotonic() - self._last_flush > self.max_delay):
+            self.flush()
+
+    def flush(self):
+        """Write all buffered tokens to stdout."""
+        if self._buffer:
+            sys.stdout.write("".join(self._buffer))
+            self._buffer.clear()
+        sys.stdout.flush()
+        self._last_flush = time.monotonic()
+
+
+async def batch_tokens(
+    tokens: AsyncIterator[str],
+    max_tokens: int = 8,
+    max_delay: float = 0.025
+) -> AsyncIterator[str]:
+    """
+    Coalesce streamed tokens into larger pieces for fewer, bigger writes.
+
+    Args:
+        tokens: Async iterator of answer tokens
+        max_tokens: Emit once this many tokens are buffered
+        max_delay: Emit once this many seconds passed since the last emit
+
+    Yields:
+        Concatenated tokens
+    """
+    buffer = []
+    last_flush = time.monotonic()
+    async for token in tokens:
+        buffer.append(token)
+        if len(buffer) >= max_tokens or time.monotonic() - last_flush > max_delay:
+            yield "".join(buffer)
+            buffer.clear()
+            last_flush = time.monotonic()
+    if buffer:
+        yield "".join(buffer)
 
 
 class QueryEngine:
     """Query engine for searching and generating answers."""
 
-    def __init__(self, config: RAGLiteConfig):
+    def __init__(self, config: RAGLiteConfig, rerank: bool = False):
         """
         Initialize the query engine.
 
         Args:
             config: RAGLite configuration
+            rerank: Rerank the fused search results with the configured reranker
         """
         self.config = config
+        self.rerank = rerank and bool(config.reranker)
+
+        # Dedicated threads for embedding calls, so they never queue behind
+        # database searches in the event loop's default executor
+        self._embed_pool = ThreadPoolExecutor(max_workers=EMBED_WORKERS, thread_name_prefix="embed")
+
+    def close(self):
+        """Shut down the embedding worker threads."""
+        self._embed_pool.shutdown(wait=False, cancel_futures=True)
 
     def query(self, question: str, stream: bool = False) -> str:
         """
@@ -49,12 +173,143 @@ class QueryEngine:
             # Return generator for streaming
             return response_stream
         else:
-            # Collect full response
-            full_response = ""
-            for chunk in response_stream:
-                if chunk:
-                    full_response += chunk
-            return full_response
+            # Collect full response (RAGLite's rag() only streams, so join in C)
+            return "".join(chunk for chunk in response_stream if chunk)
+
+    def embed(self, question: str) -> np.ndarray:
+        """
+        Embed a question, reusing the cached embedding for repeated questions.
+
+        Args:
+            question: The question to embed
+
+        Returns:
+            The question embedding
+        """
+        return _embed_cached(normalize_question(question), self.config)
+
+    async def aembed(self, question: str) -> np.ndarray:
+        """
+        Embed a question on the dedicated embedding threads.
+
+        Args:
+            question: The question to embed
+
+        Returns:
+            The question embedding
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._embed_pool, self.embed, question)
+
+    def _vector_search(
+        self,
+        question: str,
+        num_results: int,
+        metadata_filter: Optional[Dict] = None
+    ) -> List[str]:
+        """Rank chunk ids by embedding similarity (the question embedding is cached)."""
+        chunk_ids, _ = vector_search(
+            self.embed(question),
+            num_results=num_results,
+            metadata_filter=metadata_filter,
+            config=self.config
+        )
+        return chunk_ids
+
+    def _keyword_search(
+        self,
+        question: str,
+        num_results: int,
+        metadata_filter: Optional[Dict] = None
+    ) -> List[str]:
+        """Rank chunk ids by BM25 keyword relevance."""
+        chunk_ids, _ = keyword_search(
+            question,
+            num_results=num_results,
+            metadata_filter=metadata_filter,
+            config=self.config
+        )
+        return chunk_ids
+
+    @staticmethod
+    def _fuse(vector_ids: List[str], keyword_ids: List[str], num_chunks: int) -> List[str]:
+        """Merge vector and keyword rankings with Reciprocal Rank Fusion."""
+        chunk_ids, _ = reciprocal_rank_fusion([vector_ids, keyword_ids], weights=list(HYBRID_WEIGHTS))
+        return chunk_ids[:num_chunks]
+
+    def _chunk_spans(self, question: str, chunk_ids: List[str], num_chunks: int) -> List:
+        """Expand fused chunk ids into chunk spans, reranking them first if enabled."""
+        if self.rerank:
+            chunk_ids = rerank_chunks(question, chunk_ids, config=self.config)[:num_chunks]
+        return retrieve_chunk_spans(chunk_ids, config=self.config)
+
+    def retrieve(
+        self,
+        question: str,
+        num_chunks: int = 5,
+        metadata_filter: Optional[Dict] = None
+    ) -> List:
+        """
+        Retrieve context chunk spans for a question with hybrid search.
+
+        Vector and BM25 keyword results are merged with Reciprocal Rank
+        Fusion, as in RAGLite's hybrid_search, but the question embedding is
+        cached so repeated questions skip the embedding API call. With
+        reranking enabled, all fused candidates are reranked before the top
+        num_chunks are kept.
+
+        Args:
+            question: The question to ask
+            num_chunks: Number of chunks to retrieve (default: 5)
+            metadata_filter: Only search chunks whose document metadata matches,
+                e.g. {'category': 'column'} (a list of values matches any of them)
+
+        Returns:
+            List of ChunkSpan objects ordered by relevance
+        """
+        num_results = HYBRID_OVERSAMPLE * num_chunks
+        chunk_ids = self._fuse(
+            self._vector_search(question, num_results, metadata_filter),
+            self._keyword_search(question, num_results, metadata_filter),
+            num_results if self.rerank else num_chunks
+        )
+        return self._chunk_spans(question, chunk_ids, num_chunks)
+
+    async def aretrieve(
+        self,
+        question: str,
+        num_chunks: int = 5,
+        metadata_filter: Optional[Dict] = None
+    ) -> List:
+        """
+        Asynchronously retrieve context, running vector and keyword search concurrently.
+
+        RAGLite's searches are synchronous database calls, so each runs in a
+        worker thread and the total latency is that of the slower one. The
+        question is embedded on the embedding threads while the keyword
+        search is already running.
+
+        Args:
+            question: The question to ask
+            num_chunks: Number of chunks to retrieve (default: 5)
+            metadata_filter: Only search chunks whose document metadata matches
+
+        Returns:
+            List of ChunkSpan objects ordered by relevance
+        """
+        num_results = HYBRID_OVERSAMPLE * num_chunks
+
+        async def search_vectors() -> List[str]:
+            # Embedding first fills the cache, so the search thread only queries the index
+            await self.aembed(question)
+            return await asyncio.to_thread(self._vector_search, question, num_results, metadata_filter)
+
+        vector_ids, keyword_ids = await asyncio.gather(
+            search_vectors(),
+            asyncio.to_thread(self._keyword_search, question, num_results, metadata_filter)
+        )
+        chunk_ids = self._fuse(vector_ids, keyword_ids, num_results if self.rerank else num_chunks)
+        return await asyncio.to_thread(self._chunk_spans, question, chunk_ids, num_chunks)
 
     def query_with_sources(self, question: str, num_chunks: int = 5) -> Dict:
         """
@@ -71,12 +326,8 @@ class QueryEngine:
                 - sources: List of source documents with metadata
                 - num_sources: Number of sources
         """
-        # 1. Retrieve context using RAGLite's high-level API
-        chunk_spans = retrieve_context(
-            query=question,
-            num_chunks=num_chunks,
-            config=self.config
-        )
+        # 1. Retrieve context (the question embedding is cached)
+        chunk_spans = self.retrieve(question, num_chunks)
 
         # 2. Add context to create RAG instruction
         messages = [add_context(user_prompt=question, context=chunk_spans)]
@@ -86,6 +337,54 @@ class QueryEngine:
         answer = "".join(chunk for chunk in stream if chunk)
 
         # 4. Extract source information from chunk_spans
+        sources = self._build_sources(chunk_spans)
+
+        return {
+            "question": question,
+            "answer": answer,
+            "sources": sources,
+            "num_sources": len(sources)
+        }
+
+    async def stream_with_sources(
+        self,
+        question: str,
+        num_chunks: int = 5,
+        metadata_filter: Optional[Dict] = None
+    ) -> Tuple[List[Dict], AsyncIterator[str]]:
+        """
+        Retrieve sources, then stream the answer tokens as the LLM generates them.
+
+        Retrieval finishes before generation starts, so the sources are known
+        up front while the first answer token arrives after prefill only.
+
+        Args:
+            question: The question to ask
+            num_chunks: Number of chunks to retrieve (default: 5)
+            metadata_filter: Only search chunks whose document metadata matches
+
+        Returns:
+            Tuple of (sources in the query_with_sources format, async iterator of answer tokens)
+        """
+        # Vector and keyword search run concurrently, off the event loop
+        chunk_spans = await self.aretrieve(question, num_chunks, metadata_filter)
+
+        messages = [add_context(user_prompt=question, context=chunk_spans)]
+        tokens = (token async for token in async_rag(messages, config=self.config) if token)
+
+        return self._build_sources(chunk_spans), tokens
+
+    @staticmethod
+    def _build_sources(chunk_spans) -> List[Dict]:
+        """
+        Convert retrieved chunk spans into source dictionaries.
+
+        Args:
+            chunk_spans: ChunkSpan objects ordered by relevance
+
+        Returns:
+            List of source documents with metadata
+        """
         sources = []
         for i, chunk_span in enumerate(chunk_spans, 1):
             # Extract pure text content without metadata and front matter
@@ -103,6 +402,25 @@ class QueryEngine:
             }
             sources.append(source)
 
+        return sources
+
+    async def aquery_with_sources(self, question: str, num_chunks: int = 5) -> Dict:
+        """
+        Asynchronously query the RAG system and return answer with sources.
+
+        Retrieval runs its searches concurrently and generation uses RAGLite's
+        async LLM stream, so the event loop is never blocked.
+
+        Args:
+            question: The question to ask
+            num_chunks: Number of chunks to retrieve (default: 5)
+
+        Returns:
+            Same dictionary as query_with_sources
+        """
+        sources, tokens = await self.stream_with_sources(question, num_chunks)
+        answer = "".join([token async for token in tokens])
+
         return {
             "question": question,
             "answer": answer,
@@ -110,6 +428,44 @@ class QueryEngine:
             "num_sources": len(sources)
         }
 
+    async def abatch_query(
+        self,
+        questions: List[str],
+        num_chunks: int = 5,
+        max_concurrency: int = 8
+    ) -> List[Dict]:
+        """
+        Answer several questions concurrently.
+
+        Args:
+            questions: The questions to ask
+            num_chunks: Number of chunks to retrieve per question (default: 5)
+            max_concurrency: Maximum number of questions in flight (respects rate limits)
+
+        Returns:
+            List of results in the same order as the questions
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(question: str) -> Dict:
+            async with semaphore:
+                return await self.aquery_with_sources(question, num_chunks)
+
+        return await asyncio.gather(*(run(question) for question in questions))
+
+    def batch_query(self, questions: List[str], num_chunks: int = 5) -> List[Dict]:
+        """
+        Answer several questions, running them concurrently.
+
+        Args:
+            questions: The questions to ask
+            num_chunks: Number of chunks to retrieve per question (default: 5)
+
+        Returns:
+            List of results in the same order as the questions
+        """
+        return asyncio.run(self.abatch_query(questions, num_chunks))
+
     @staticmethod
     def _format_source(chunk_span, index: int) -> str:
         """
@@ -128,15 +484,7 @@ class QueryEngine:
         category = doc.metadata_.get('category', 'general')
         url = doc.url or doc.filename
 
-        # Category labels in Japanese
-        category_labels = {
-            'idea': '基本理念',
-            'posture': '政治姿勢',
-            'results': '実績',
-            'kaiken': '記者会見',
-            'column': 'コラム',
-        }
-        category_jp = category_labels.get(category, category)
+        category_jp = CATEGORY_LABELS.get(category, category)
 
         # Extract pure text content without metadata and front matter
         pure_content = "".join(chunk.body for chunk in chunk_span.chunks)
@@ -171,22 +519,20 @@ class QueryEngine:
 
                 print("\n回答を生成中...\n")
 
-                # Retrieve context using RAGLite's high-level API
-                chunk_spans = retrieve_context(
-                    query=question,
-                    num_chunks=5,
-                    config=self.config
-                )
+                # Retrieve context (the question embedding is cached)
+                chunk_spans = self.retrieve(question, num_chunks=5)
 
                 # Add context to create RAG instruction
                 messages = [add_context(user_prompt=question, context=chunk_spans)]
 
-                # Stream the response
+                # Stream the response (batched writes instead of one flush per token)
                 print("回答: ", end="", flush=True)
                 stream = rag(messages, config=self.config)
+                output = TokenBuffer()
                 for chunk in stream:
                     if chunk:
-                        print(chunk, end="", flush=True)
+                        output.write(chunk)
+                output.flush()
 
                 # Display source citations
                 if chunk_spans:
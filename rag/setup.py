@@ -1,16 +1,87 @@
 """Setup and configuration for RAGLite."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
+import httpx
+import litellm
 from raglite import RAGLiteConfig
+from raglite._database import create_database_engine
 from rerankers import Reranker
+from sqlalchemy import text
+
+# Default download location for reranker models
+RERANKER_CACHE_DIR = Path(__file__).parent.parent / "models"
+
+@lru_cache(maxsize=1)
+def get_reranker() -> Reranker:
+    """
+    Load the multilingual reranker on first use.
+
+    Returns:
+        Shared FlashRank Reranker instance
+    """
+    # Using FlashRank with multilingual model (supports 100+ languages including Japanese).
+    # FlashRank ships this model int8-quantized (flashrank-MultiBERT-L12_Q.onnx); pin its
+    # cache to the project so it is downloaded once rather than per working directory.
+    cache_dir = os.getenv("RERANKER_CACHE_DIR", str(RERANKER_CACHE_DIR))
+    return Reranker(
+        "ms-marco-MultiBERT-L-12",
+        model_type="flashrank",
+        verbose=0,
+        cache_dir=cache_dir
+    )
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """
+    Create the shared pooled HTTP client used for OpenAI calls.
+
+    The client is registered with LiteLLM so embedding and completion
+    requests reuse keep-alive (HTTP/2) connections instead of opening a new
+    connection per call. The async counterpart used by async_rag is
+    registered at the same time.
+
+    Returns:
+        Shared httpx.Client instance
+    """
+    client = httpx.Client(
+        http2=True,
+        timeout=60,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+    )
+    litellm.client_session = client
+    get_async_http_client()
+    return client
+
+
+@lru_cache(maxsize=1)
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Create the shared pooled async HTTP client used for async OpenAI calls.
+
+    LiteLLM's async completion and embedding calls (acompletion, used by the
+    streaming chat endpoint) use this client instead of the sync one.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    client = httpx.AsyncClient(
+        http2=True,
+        timeout=60,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+    )
+    litellm.aclient_session = client
+    return client
 
 
 def setup_raglite(
     db_path: str = "raglite.db",
     llm_model: str = "gpt-4o-mini",
     embedding_model: str = "text-embedding-3-large",
-    api_key: str = None
+    api_key: str = None,
+    reranker: Reranker = None
 ) -> RAGLiteConfig:
     """
     Set up RAGLite with Japanese language support.
@@ -20,6 +91,7 @@ def setup_raglite(
         llm_model: OpenAI model for generation (default: gpt-4o-mini)
         embedding_model: OpenAI embedding model (default: text-embedding-3-large)
         api_key: OpenAI API key (if not provided, reads from environment)
+        reranker: Reranker to use (if not provided, the shared reranker is loaded)
 
     Returns:
         RAGLiteConfig object configured for Japanese
@@ -33,6 +105,9 @@ def setup_raglite(
     # Set OpenAI API key in environment for LiteLLM
     os.environ["OPENAI_API_KEY"] = api_key
 
+    # Reuse pooled connections for all OpenAI calls
+    get_http_client()
+
     # Create configuration for Japanese language support
     config = RAGLiteConfig(
         # Database configuration
@@ -43,13 +118,62 @@ def setup_raglite(
         embedder=embedding_model,
 
         # Reranker configuration for Japanese
-        # Using FlashRank with multilingual model (supports 100+ languages including Japanese)
-        reranker=Reranker("ms-marco-MultiBERT-L-12", model_type="flashrank", verbose=0)
+        reranker=reranker or get_reranker()
     )
 
+    configure_database(config)
+
     return config
 
 
+def configure_database(
+    config: RAGLiteConfig,
+    threads: int = None,
+    memory_limit: str = None,
+    ef_search: int = None
+) -> bool:
+    """
+    Apply DuckDB performance settings to the RAGLite database.
+
+    Opening the engine also makes RAGLite create its HNSW vector index
+    (cosine metric) and full-text index if they are missing, so retrieval
+    uses approximate nearest-neighbour search instead of an exact scan.
+    The HNSW search width can be tuned to trade recall for latency.
+
+    Args:
+        config: RAGLiteConfig object whose database should be tuned
+        threads: Number of DuckDB worker threads (default: CPU count)
+        memory_limit: DuckDB memory limit (default: DUCKDB_MEMORY_LIMIT or 2GB)
+        ef_search: HNSW candidate list size per query (default: DUCKDB_HNSW_EF_SEARCH,
+            or RAGLite's own setting if unset)
+
+    Returns:
+        True if the settings were applied
+    """
+    if not str(config.db_url).startswith("duckdb://"):
+        return False
+
+    threads = threads or os.cpu_count() or 1
+    memory_limit = memory_limit or os.getenv("DUCKDB_MEMORY_LIMIT", "2GB")
+    ef_search = ef_search or os.getenv("DUCKDB_HNSW_EF_SEARCH")
+
+    try:
+        engine = create_database_engine(config)
+        with engine.connect() as connection:
+            connection.execute(text(f"SET threads = {int(threads)}"))
+            connection.execute(text(f"SET memory_limit = '{memory_limit}'"))
+            if ef_search:
+                # Applies to every connection RAGLite opens for vector search
+                connection.execute(text(f"SET GLOBAL hnsw_ef_search = {int(ef_search)}"))
+            connection.commit()
+    except Exception as e:
+        # Older DuckDB versions may not support every setting
+        print(f"Warning: could not apply DuckDB settings: {e}")
+        return False
+
+    return True
+
+
 def get_japanese_prompts():
     """
     Get Japanese language prompts for the RAG system.
@@ -97,4 +221,6 @@ def validate_configuration(config: RAGLiteConfig) -> bool:
         if not db_dir.exists():
             db_dir.mkdir(parents=True, exist_ok=True)
 
+    configure_database(config)
+
     return True
\ No newline at end of file
@@ -1,17 +1,173 @@
 """Web crawler for scraping content from Sanae's website."""
 
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import re
 import time
 import json
-from typing import List, Dict, Set, Optional
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Set, Optional, Tuple
 from pathlib import Path
 from urllib.parse import urljoin
-import requests
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
-from tqdm import tqdm
+import charset_normalizer
+import httpx
+from tqdm.asyncio import tqdm_asyncio
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library encoder
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying with backoff (rate limiting and transient server errors)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Link patterns, compiled once per process
+_MEDIA_RE = re.compile(r'\.(?:jpe?g|png|gif|pdf|mp[34])$', re.I)
+_RESULTS_DETAIL_RE = re.compile(r'results_[^/]+\.html')
+_COLUMN_LIST_RE = re.compile(r'column_list\d+\.html')
+_COLUMN_DETAIL_RE = re.compile(r'column_detail\d+\.html')
+_KAIKEN_LIST_RE = re.compile(r'kaiken_list\d+\.html')
+_KAIKEN_DETAIL_RE = re.compile(r'kaiken_detail\d+\.html')
+
+# Substrings a link must contain to be followed within a category
+_CATEGORY_NEEDLES = {
+    "column": ("column",),
+    "kaiken": ("kaiken",),
+    "idea": ("idea", "policy"),
+    "posture": ("posture", "stance"),
+    "results": ("result", "achievement"),
+}
+
 from .parser import HTMLParser
 
 
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?\s*([A-Za-z0-9_\-]+)', re.I)
+_DIGITS_WS_RE = re.compile(r'\d+|\s+')
+
+
+def _content_digest(text: str) -> bytes:
+    """
+    Digest page text for near-duplicate detection.
+
+    Digits and whitespace are stripped first, so pages differing only in
+    dates or counters get the same digest.
+
+    Args:
+        text: Extracted page content
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    summary = _DIGITS_WS_RE.sub('', text)
+    return hashlib.blake2b(summary.encode('utf-8'), digest_size=16).digest()
+
+
+def _detect_encoding(response: httpx.Response, body: bytes) -> str:
+    """
+    Determine a response's encoding without statistical detection.
+
+    Checks the Content-Type charset, then a <meta charset> declaration in the
+    first 2KB of the body, and falls back to UTF-8.
+
+    Args:
+        response: The HTTP response
+        body: The response body
+
+    Returns:
+        Encoding name
+    """
+    if response.charset_encoding:
+        return response.charset_encoding
+
+    match = _META_CHARSET_RE.search(body[:2048])
+    if match:
+        return match.group(1).decode('ascii')
+
+    return 'utf-8'
+
+
+def _decode_response(response: httpx.Response, body: bytes) -> str:
+    """
+    Decode a response body, detecting the charset only if decoding fails.
+
+    Args:
+        response: The HTTP response
+        body: The response body
+
+    Returns:
+        Decoded HTML text
+    """
+    try:
+        return body.decode(_detect_encoding(response, body))
+    except (UnicodeDecodeError, LookupError):
+        # Last resort for mislabelled Japanese pages (e.g. Shift_JIS served as UTF-8)
+        best = charset_normalizer.from_bytes(body).best()
+        return body.decode(best.encoding if best else 'utf-8', errors='replace')
+
+
+def _parse_job(html: str, url: str, base_url: str) -> Tuple[Dict, List[str]]:
+    """
+    Parse a page in a worker process.
+
+    Defined at module level so it can be pickled for the process pool; the
+    parsed tree itself never leaves the worker. The page is parsed once and
+    both links and content are taken from that tree.
+
+    Args:
+        html: The HTML content
+        url: The URL of the page
+        base_url: The site base URL for link filtering
+
+    Returns:
+        Tuple of (content data, internal links)
+    """
+    parser = HTMLParser(base_url)
+    soup = parser.parse(html)
+    # Links first: content extraction removes <noscript> and <iframe> elements
+    links = parser.extract_links_from_soup(soup, url)
+    content_data = parser.extract_content_from_soup(soup, url)
+    return content_data, links
+
+
+class RateLimiter:
+    """Token-bucket rate limiter shared by all concurrent requests."""
+
+    def __init__(self, requests_per_second: Optional[float], burst: float = 1.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_second: Sustained request rate (None disables limiting)
+            burst: Maximum number of requests that may be sent back-to-back
+        """
+        self.rate = requests_per_second
+        self.capacity = max(1.0, burst)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+
+    async def acquire(self):
+        """Wait until a request may be sent and consume one token."""
+        if not self.rate:
+            return
+
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
 class WebCrawler:
     """Crawler for collecting content from Sanae's website."""
 
@@ -25,49 +181,87 @@ class WebCrawler:
         """
         self.config = config
         self.base_url = config['base_url']
+        # Scheme + host + "/", so same-site checks are a plain prefix match
+        self._base_url_prefix = self.base_url.rstrip('/') + '/'
         self.data_dir = data_dir
         self.parser = HTMLParser(self.base_url)
 
-        # Set up session with retry logic
-        self.session = self._create_session()
+        # Parsing is CPU-bound, so it runs in worker processes during a crawl
+        self.parse_workers = config.get('parse_workers') or os.cpu_count()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        # Maximum number of requests in flight (semaphore is created per crawl)
+        self.concurrency = config.get('concurrency', 10)
+        self.sem = None
+
+        # Global request rate cap (politeness), shared by all concurrent fetches
+        delay = config['delay_between_requests']
+        self.limiter = RateLimiter(requests_per_second=1.0 / delay if delay > 0 else None)
+
+        # Retries for transient failures (network errors, 429 and 5xx)
+        self.max_retries = config.get('max_retries', 3)
+        self.backoff = config.get('retry_backoff', 1.0)
+
+        # Pages larger than this are not downloaded in full
+        self.max_page_bytes = config.get('max_page_bytes', 2_000_000)
 
         # Track visited URLs to avoid duplicates
         self.visited_urls = set()
-        self.scraped_data = []
+        # Scraped pages bucketed by category, so each save touches only its own pages
+        self._by_category: Dict[str, List[Dict]] = defaultdict(list)
 
         # Timestamp for consistent file naming across categories
         self.timestamp = None
         self.saved_files = []
 
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic."""
-        session = requests.Session()
+        # Internal links of each parsed page, so a page reached again (e.g. a
+        # list page shared by two sections) is neither downloaded nor parsed twice
+        self._page_links: Dict[str, List[str]] = {}
 
-        # Set up retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        # Content digests of stored pages, used to drop near-duplicates
+        self._seen_digests: Set[bytes] = set()
 
-        # Set headers
-        session.headers.update(self.config['headers'])
+    def _create_client(self) -> httpx.AsyncClient:
+        """
+        Create an async HTTP client shared by every request of a crawl.
 
-        return session
+        All pages live on the same host, so one pooled transport keeps
+        HTTP/2 connections alive across the whole crawl instead of paying a
+        TCP+TLS handshake per page. Failures are retried with backoff in
+        _afetch rather than by the transport.
+        """
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            )
+        )
+        return httpx.AsyncClient(
+            transport=transport,
+            base_url=self.base_url,
+            headers=self.config['headers'],
+            timeout=self.config['timeout'],
+            follow_redirects=True
+        )
 
-    def crawl_all_pages(self) -> List[Dict]:
+    def crawl_all_pages(self, targets: Optional[List[Tuple[str, str]]] = None) -> List[Dict]:
         """
         Crawl all target pages and their subpages.
         Each category is saved immediately after crawling.
 
+        Args:
+            targets: Optional list of (category, absolute URL) pairs
+                     (defaults to the target pages in the configuration)
+
         Returns:
             List of scraped data dictionaries (empty if saved incrementally)
         """
+        return asyncio.run(self._acrawl_all_pages(targets))
+
+    async def _acrawl_all_pages(self, targets: Optional[List[Tuple[str, str]]] = None) -> List[Dict]:
+        """Asynchronous implementation of crawl_all_pages."""
         print("Starting web crawling...")
         print("="*50)
 
@@ -75,41 +269,48 @@ class WebCrawler:
         if self.timestamp is None:
             self.timestamp = int(time.time())
 
+        if targets is None:
+            targets = [
+                (page_name, urljoin(self.base_url, page_path))
+                for page_name, page_path in self.config['target_pages'].items()
+            ]
+
         total_pages = 0
+        self.sem = asyncio.Semaphore(self.concurrency)
 
-        # Crawl main target pages
-        for page_name, page_path in self.config['target_pages'].items():
-            url = urljoin(self.base_url, page_path)
-            print(f"\n📂 Crawling {page_name}: {url}")
-            print("-"*50)
-
-            # Special handling for different page types based on their structure
-            if page_name == "idea" or page_name == "posture":
-                # Single pages - simple crawling
-                self._crawl_single_page(url, page_name)
-            elif page_name == "results":
-                # List page with direct content pages
-                self._crawl_results_pages(url)
-            elif page_name == "kaiken":
-                # Two-level structure: main → list pages → detail pages
-                self._crawl_kaiken_pages(url)
-            elif page_name == "column":
-                # Complex structure with list and detail pages
-                self._crawl_column_pages(url)
-            else:
-                # Default crawling
-                self._crawl_page_and_subpages(url, page_name)
-
-            # Save this category's data immediately
-            saved_file = self._save_category_data(page_name)
-            if saved_file:
-                # Count pages before they're removed from scraped_data
-                with open(saved_file, 'r', encoding='utf-8') as f:
-                    category_data = json.load(f)
-                    total_pages += len(category_data)
-
-            # Be polite to the server
-            time.sleep(self.config['delay_between_requests'])
+        self._pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        try:
+            async with self._create_client() as client:
+                # Crawl main target pages
+                for page_name, url in targets:
+                    print(f"\n📂 Crawling {page_name}: {url}")
+                    print("-"*50)
+
+                    # Special handling for different page types based on their structure
+                    if page_name == "idea" or page_name == "posture":
+                        # Single pages - simple crawling
+                        await self._crawl_single_page(client, url, page_name)
+                    elif page_name == "results":
+                        # List page with direct content pages
+                        await self._crawl_results_pages(client, url)
+                    elif page_name == "kaiken":
+                        # Two-level structure: main → list pages → detail pages
+                        await self._crawl_kaiken_pages(client, url)
+                    elif page_name == "column":
+                        # Complex structure with list and detail pages
+                        await self._crawl_column_pages(client, url)
+                    else:
+                        # Default crawling
+                        await self._crawl_page_and_subpages(client, url, page_name)
+
+                    # Save this category's data immediately
+                    saved_file, count = self._save_category_data(page_name)
+                    if saved_file:
+                        total_pages += count
+        finally:
+            # Stop the parser processes once the crawl is over
+            self._pool.shutdown()
+            self._pool = None
 
         print("\n" + "="*50)
         print(f"✅ Crawling complete! Scraped {total_pages} pages total.")
@@ -117,235 +318,370 @@ class WebCrawler:
         print("="*50)
         return self.scraped_data
 
-    def _crawl_single_page(self, url: str, category: str):
+    async def _crawl_single_page(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        category: str
+    ) -> Optional[List[str]]:
         """
         Crawl a single page without following subpages.
 
         Args:
+            client: The shared HTTP client
             url: The URL to crawl
             category: The category of the page
+
+        Returns:
+            The page's internal links (reused for link discovery) or None if failed
         """
-        if url in self.visited_urls:
-            return
+        try:
+            if url in self.visited_urls:
+                return self._page_links.get(url)
+
+            self.visited_urls.add(url)
+
+            # Fetch and parse the page once for both content and links
+            html = await self._afetch(client, url)
+            if not html:
+                return None
+            content_data, links = await self._parse(html, url)
+            self._page_links[url] = links
+            self._store_content(category, content_data)
+            return links
+        except Exception:
+            # One broken page must not abort the whole section
+            logger.exception("Error crawling %s", url)
+            return None
+
+    async def _parse(self, html: str, url: str) -> Tuple[Dict, List[str]]:
+        """
+        Parse a page off the event loop.
 
-        self.visited_urls.add(url)
+        Args:
+            html: The HTML content
+            url: The URL of the page
 
-        # Fetch and parse the page
-        html = self._fetch_page(url)
-        if not html:
-            return
+        Returns:
+            Tuple of (content data, internal links)
+        """
+        if self._pool is None:
+            return _parse_job(html, url, self.base_url)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, _parse_job, html, url, self.base_url)
+
+    def _store_content(self, category: str, content_data: Dict, **extra):
+        """
+        Store extracted page content if it is substantial and not a duplicate.
 
-        # Parse content
-        content_data = self.parser.extract_content(html, url)
+        Args:
+            category: The category of the page
+            content_data: Content extracted by the parser
+            **extra: Additional fields to store with the page (e.g. depth)
+        """
         content_data['category'] = category
+        content_data.update(extra)
 
         # Save if content is substantial (100 characters minimum for Japanese content)
         if content_data['word_count'] > 100:
-            self.scraped_data.append(content_data)
+            # Skip pages whose content was already stored under another URL;
+            # only stored pages claim their digest
+            digest = _content_digest(content_data['content'])
+            if digest in self._seen_digests:
+                print(f"  ⊘ Skipped: {content_data['title'][:50]}... (duplicate content)")
+                return
+            self._seen_digests.add(digest)
+
+            self._by_category[category].append(content_data)
             print(f"  ✓ Scraped: {content_data['title'][:50]}... ({content_data['word_count']} chars)")
         else:
             print(f"  ⊘ Skipped: {content_data['title'][:50]}... ({content_data['word_count']} chars - too short)")
 
-    def _crawl_page_and_subpages(self, url: str, category: str, max_depth: int = 2, current_depth: int = 0):
+    async def _crawl_page_and_subpages(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        category: str,
+        max_depth: int = 2
+    ):
         """
-        Crawl a page and its subpages recursively.
+        Crawl a page and its subpages breadth-first with a pool of workers.
 
         Args:
+            client: The shared HTTP client
             url: The URL to crawl
             category: The category of the page
             max_depth: Maximum crawling depth
-            current_depth: Current crawling depth
         """
-        # Skip if already visited or max depth reached
-        if url in self.visited_urls or current_depth > max_depth:
-            return
-
-        self.visited_urls.add(url)
-
-        # Fetch the page
-        html = self._fetch_page(url)
-        if not html:
-            return
-
-        # Parse content
-        content_data = self.parser.extract_content(html, url)
-        content_data['category'] = category
-        content_data['depth'] = current_depth
-
-        # Only save if content is substantial (100 characters minimum for Japanese content)
-        if content_data['word_count'] > 100:
-            self.scraped_data.append(content_data)
-            print(f"  Scraped: {content_data['title'][:50]}... ({content_data['word_count']} chars)")
-
-        # Extract and crawl subpage links
-        if current_depth < max_depth:
-            links = self.parser.extract_links(html, url)
-            for link in links:
-                # Only follow links that seem related to the category
-                if self._should_follow_link(link, category):
-                    self._crawl_page_and_subpages(link, category, max_depth, current_depth + 1)
-                    time.sleep(self.config['delay_between_requests'])
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait((url, 0))
+
+        workers = [
+            asyncio.create_task(self._worker(client, queue, category, max_depth))
+            for _ in range(self.concurrency)
+        ]
+
+        # Wait until every discovered page has been processed
+        await queue.join()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _worker(
+        self,
+        client: httpx.AsyncClient,
+        queue: asyncio.Queue,
+        category: str,
+        max_depth: int
+    ):
+        """
+        Take (url, depth) items off the queue, crawl them and enqueue their subpages.
 
-    def _crawl_results_pages(self, url: str):
+        Args:
+            client: The shared HTTP client
+            queue: Queue of (url, depth) pairs to crawl
+            category: The category of the pages
+            max_depth: Maximum crawling depth
+        """
+        while True:
+            url, depth = await queue.get()
+            try:
+                # visited_urls is only touched between awaits, so no lock is needed
+                if url in self.visited_urls:
+                    continue
+                self.visited_urls.add(url)
+
+                html = await self._afetch(client, url)
+                if not html:
+                    continue
+
+                content_data, links = await self._parse(html, url)
+                self._page_links[url] = links
+                self._store_content(category, content_data, depth=depth)
+
+                # Enqueue subpage links that seem related to the category
+                if depth < max_depth:
+                    for link in links:
+                        if link not in self.visited_urls and self._should_follow_link(link, category):
+                            queue.put_nowait((link, depth + 1))
+            except Exception:
+                logger.exception("Error crawling %s", url)
+            finally:
+                queue.task_done()
+
+    async def _crawl_results_pages(self, client: httpx.AsyncClient, url: str):
         """
         Crawl results pages (実績).
         Structure: main page → results_*.html content pages
 
         Args:
+            client: The shared HTTP client
             url: The results main page URL
         """
         print("  📋 Fetching results pages...")
 
-        # First, crawl the main results page
-        self._crawl_single_page(url, "results")
-
-        # Fetch the main page to find result links
-        html = self._fetch_page(url)
-        if not html:
+        # Crawl the main results page, keeping its links to find result pages
+        links = await self._crawl_single_page(client, url, "results")
+        if not links:
             return
 
         # Look for results_*.html pages (e.g., results_japan7.html, results_nara6.html)
-        results_links = self.parser.extract_subpage_links(html, url, pattern=r'results_[^/]+\.html')
+        results_links = self.parser.filter_links(links, _RESULTS_DETAIL_RE)
 
         print(f"  Found {len(results_links)} results pages")
 
-        # Crawl each results page
-        for link in tqdm(results_links, desc="  Crawling results"):
-            if link not in self.visited_urls:
-                self._crawl_single_page(link, "results")
-                time.sleep(self.config['delay_between_requests'])
+        # Crawl all results pages concurrently
+        await tqdm_asyncio.gather(
+            *(self._crawl_single_page(client, link, "results")
+              for link in results_links if link not in self.visited_urls),
+            desc="  Crawling results"
+        )
 
         print(f"  ✅ Results section complete: {len(results_links) + 1} pages")
 
-    def _crawl_column_pages(self, url: str):
+    async def _crawl_column_pages(self, client: httpx.AsyncClient, url: str):
         """
         Crawl column pages (コラム).
         Structure: main page → column_list*.html → column_detail*.html
                    main page also has direct links to recent column_detail*.html
 
         Args:
+            client: The shared HTTP client
             url: The column main page URL
         """
         print("  📝 Fetching column pages...")
 
-        # First, crawl the main column page
-        self._crawl_single_page(url, "column")
-
-        # Fetch the main page to find both list pages and detail pages
-        html = self._fetch_page(url)
-        if not html:
+        # Crawl the main column page, keeping its links to find list and detail pages
+        links = await self._crawl_single_page(client, url, "column")
+        if not links:
             return
 
         # Look for column_list*.html pages
-        list_links = self.parser.extract_subpage_links(html, url, pattern=r'column_list\d+\.html')
+        list_links = self.parser.filter_links(links, _COLUMN_LIST_RE)
         print(f"  Found {len(list_links)} column list pages")
 
         # Look for column_detail*.html pages on the main page (recent articles)
-        all_detail_links = self.parser.extract_subpage_links(html, url, pattern=r'column_detail\d+\.html')
+        all_detail_links = self.parser.filter_links(links, _COLUMN_DETAIL_RE)
         print(f"  Found {len(all_detail_links)} recent column articles on main page")
 
-        # Process each list page to find more detail pages
-        for list_url in tqdm(list_links, desc="  Processing list pages"):
-            if list_url not in self.visited_urls:
-                # Crawl the list page itself
-                self._crawl_single_page(list_url, "column")
-
-                # Fetch list page to find detail links
-                list_html = self._fetch_page(list_url)
-                if list_html:
-                    # Look for column_detail*.html pages
-                    detail_links = self.parser.extract_subpage_links(
-                        list_html, list_url, pattern=r'column_detail\d+\.html'
-                    )
-                    all_detail_links.extend(detail_links)
-                    time.sleep(self.config['delay_between_requests'])
-
-        # Remove duplicates
-        all_detail_links = list(set(all_detail_links))
+        # Crawl all list pages concurrently, keeping their links to find detail pages
+        list_page_links = await tqdm_asyncio.gather(
+            *(self._crawl_single_page(client, list_url, "column") for list_url in list_links),
+            desc="  Crawling list pages"
+        )
+
+        # Look for column_detail*.html pages (gather keeps list page order)
+        for page_links in list_page_links:
+            if page_links:
+                all_detail_links.extend(self.parser.filter_links(page_links, _COLUMN_DETAIL_RE))
+
+        # Remove duplicates, keeping discovery order for reproducible crawls
+        all_detail_links = list(dict.fromkeys(all_detail_links))
         print(f"  Found {len(all_detail_links)} column detail pages total")
 
-        # Crawl all detail pages
-        for detail_url in tqdm(all_detail_links, desc="  Crawling detail pages"):
-            if detail_url not in self.visited_urls:
-                self._crawl_single_page(detail_url, "column")
-                time.sleep(self.config['delay_between_requests'])
+        # Crawl all detail pages concurrently
+        await tqdm_asyncio.gather(
+            *(self._crawl_single_page(client, detail_url, "column")
+              for detail_url in all_detail_links if detail_url not in self.visited_urls),
+            desc="  Crawling detail pages"
+        )
 
         print(f"  ✅ Column section complete: {1 + len(list_links) + len(all_detail_links)} pages")
 
-    def _crawl_kaiken_pages(self, url: str):
+    async def _crawl_kaiken_pages(self, client: httpx.AsyncClient, url: str):
         """
         Crawl press conference pages (記者会見).
         Structure: main page → kaiken_list*.html → kaiken_detail*.html
 
         Args:
+            client: The shared HTTP client
             url: The press conference main page URL
         """
         print("  🎤 Fetching press conference pages...")
 
-        # First, crawl the main kaiken page
-        self._crawl_single_page(url, "kaiken")
-
-        # Fetch the main page to find list pages
-        html = self._fetch_page(url)
-        if not html:
+        # Crawl the main kaiken page, keeping its links to find list pages
+        links = await self._crawl_single_page(client, url, "kaiken")
+        if not links:
             return
 
         # Look for kaiken_list*.html pages
-        list_links = self.parser.extract_subpage_links(html, url, pattern=r'kaiken_list\d+\.html')
+        list_links = self.parser.filter_links(links, _KAIKEN_LIST_RE)
         print(f"  Found {len(list_links)} kaiken list pages")
 
         all_detail_links = []
 
-        # Process each list page to find detail pages
-        for list_url in tqdm(list_links, desc="  Processing list pages"):
-            if list_url not in self.visited_urls:
-                # Crawl the list page itself
-                self._crawl_single_page(list_url, "kaiken")
-
-                # Fetch list page to find detail links
-                list_html = self._fetch_page(list_url)
-                if list_html:
-                    # Look for kaiken_detail*.html pages
-                    detail_links = self.parser.extract_subpage_links(
-                        list_html, list_url, pattern=r'kaiken_detail\d+\.html'
-                    )
-                    all_detail_links.extend(detail_links)
-                    time.sleep(self.config['delay_between_requests'])
-
-        # Remove duplicates
-        all_detail_links = list(set(all_detail_links))
+        # Crawl all list pages concurrently, keeping their links to find detail pages
+        list_page_links = await tqdm_asyncio.gather(
+            *(self._crawl_single_page(client, list_url, "kaiken") for list_url in list_links),
+            desc="  Crawling list pages"
+        )
+
+        # Look for kaiken_detail*.html pages (gather keeps list page order)
+        for page_links in list_page_links:
+            if page_links:
+                all_detail_links.extend(self.parser.filter_links(page_links, _KAIKEN_DETAIL_RE))
+
+        # Remove duplicates, keeping discovery order for reproducible crawls
+        all_detail_links = list(dict.fromkeys(all_detail_links))
         print(f"  Found {len(all_detail_links)} kaiken detail pages total")
 
-        # Crawl all detail pages
-        for detail_url in tqdm(all_detail_links, desc="  Crawling detail pages"):
-            if detail_url not in self.visited_urls:
-                self._crawl_single_page(detail_url, "kaiken")
-                time.sleep(self.config['delay_between_requests'])
+        # Crawl all detail pages concurrently
+        await tqdm_asyncio.gather(
+            *(self._crawl_single_page(client, detail_url, "kaiken")
+              for detail_url in all_detail_links if detail_url not in self.visited_urls),
+            desc="  Crawling detail pages"
+        )
 
         print(f"  ✅ Kaiken section complete: {1 + len(list_links) + len(all_detail_links)} pages")
 
-    def _fetch_page(self, url: str) -> Optional[str]:
+    async def _afetch(self, client: httpx.AsyncClient, url: str) -> Optional[str]:
         """
-        Fetch a web page with error handling.
+        Fetch a web page, retrying transient failures with exponential backoff.
 
         Args:
+            client: The shared HTTP client
             url: The URL to fetch
 
         Returns:
             The HTML content or None if failed
         """
-        try:
-            response = self.session.get(url, timeout=self.config['timeout'])
-            response.raise_for_status()
-
-            # Ensure proper encoding for Japanese content
-            response.encoding = response.apparent_encoding or 'utf-8'
+        status = None
+        for attempt in range(1, self.max_retries + 1):
+            async with self.sem:
+                # Be polite to the server
+                await self.limiter.acquire()
+
+                try:
+                    status, html = await self._fetch_once(client, url)
+                except httpx.TransportError as e:
+                    # Timeouts, DNS failures, connection resets, ...
+                    logger.warning("Fetch failed for %s (attempt %d/%d)", url, attempt, self.max_retries, exc_info=e)
+                    status = None
+                except (httpx.HTTPError, ValueError) as e:
+                    # Redirect loops, invalid URLs, undecodable bodies: retrying will not help
+                    logger.warning("Fetch failed for %s: %s", url, e)
+                    return None
+
+            if status is not None and status not in _RETRY_STATUSES:
+                break
+            if status is not None:
+                logger.warning("Fetch got HTTP %d for %s (attempt %d/%d)", status, url, attempt, self.max_retries)
+
+            # Exponential backoff with jitter, outside the semaphore so other fetches proceed
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1) + random.random())
+        else:
+            return None
 
-            return response.text
-        except Exception as e:
-            print(f"  Error fetching {url}: {e}")
+        if status >= 400:
+            logger.warning("Fetch failed for %s: HTTP %d", url, status)
             return None
 
+        # None for skipped (non-HTML or oversized) pages
+        return html
+
+    async def _fetch_once(self, client: httpx.AsyncClient, url: str) -> Tuple[int, Optional[str]]:
+        """
+        Make one streamed request, giving up early on non-HTML or oversized pages.
+
+        Args:
+            client: The shared HTTP client
+            url: The URL to fetch
+
+        Returns:
+            Tuple of (HTTP status, decoded HTML); the HTML is None for error
+            statuses and skipped pages
+        """
+        async with client.stream('GET', url, timeout=self.config['timeout']) as response:
+            if response.is_error:
+                return response.status_code, None
+
+            # Skip images, PDFs and other documents linked by mistake before downloading them
+            content_type = response.headers.get('content-type', '')
+            if content_type and 'html' not in content_type:
+                logger.info("Skipping non-HTML page %s (%s)", url, content_type)
+                return response.status_code, None
+
+            try:
+                content_length = int(response.headers.get('content-length') or 0)
+            except ValueError:
+                # Malformed header; the streamed size check below still applies
+                content_length = 0
+            if content_length > self.max_page_bytes:
+                logger.info("Skipping oversized page %s (%d bytes)", url, content_length)
+                return response.status_code, None
+
+            # Stop reading once the size cap is exceeded (the length header may be missing)
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+                if len(body) > self.max_page_bytes:
+                    logger.info("Skipping oversized page %s (over %d bytes)", url, self.max_page_bytes)
+                    return response.status_code, None
+
+            # Decoded with the declared charset; detection only on failure
+            return response.status_code, _decode_response(response, bytes(body))
+
     def _should_follow_link(self, link: str, category: str) -> bool:
         """
         Determine if a link should be followed based on category.
@@ -358,30 +694,41 @@ class WebCrawler:
             True if the link should be followed
         """
         # Don't follow external links
-        if not link.startswith(self.base_url):
+        if not link.startswith(self._base_url_prefix):
             return False
 
+        low = link.lower()
+
         # Don't follow media files
-        media_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.pdf', '.mp4', '.mp3']
-        if any(link.lower().endswith(ext) for ext in media_extensions):
+        if _MEDIA_RE.search(low):
             return False
 
-        # Category-specific rules
-        if category == "column":
-            return "column" in link.lower()
-        elif category == "kaiken":
-            return "kaiken" in link.lower()
-        elif category == "idea":
-            return "idea" in link.lower() or "policy" in link.lower()
-        elif category == "posture":
-            return "posture" in link.lower() or "stance" in link.lower()
-        elif category == "results":
-            return "result" in link.lower() or "achievement" in link.lower()
+        # Category-specific rules; other categories follow anything that seems related
+        needles = _CATEGORY_NEEDLES.get(category)
+        return needles is None or any(needle in low for needle in needles)
 
-        # Default: follow if it seems related
-        return True
+    @property
+    def scraped_data(self) -> List[Dict]:
+        """Scraped pages that have not been saved yet, across all categories."""
+        return [item for items in self._by_category.values() for item in items]
 
-    def _save_category_data(self, category: str) -> Optional[Path]:
+    def _write_jsonl(self, path: Path, items: List[Dict]):
+        """
+        Write items as newline-delimited JSON (one page per line).
+
+        Args:
+            path: Destination file path
+            items: List of scraped data dictionaries
+        """
+        with open(path, 'wb') as f:
+            for item in items:
+                if orjson is not None:
+                    f.write(orjson.dumps(item))
+                else:
+                    f.write(json.dumps(item, ensure_ascii=False).encode('utf-8'))
+                f.write(b'\n')
+
+    def _save_category_data(self, category: str) -> Tuple[Optional[Path], int]:
         """
         Save data for a specific category immediately after crawling.
 
@@ -389,32 +736,29 @@ class WebCrawler:
             category: The category to save
 
         Returns:
-            Path to the saved file, or None if no data for this category
+            Tuple of (path to the saved file, number of pages saved);
+            the path is None if there was no data for this category
         """
-        # Filter data for this category
-        category_data = [item for item in self.scraped_data if item.get('category') == category]
+        # Take this category's pages, freeing them from memory once saved
+        category_data = self._by_category.pop(category, [])
 
         if not category_data:
-            return None
+            return None, 0
 
         # Use consistent timestamp across all categories
         if self.timestamp is None:
             self.timestamp = int(time.time())
 
         # Save to file
-        category_file = self.data_dir / f"{category}_{self.timestamp}.json"
-        with open(category_file, 'w', encoding='utf-8') as f:
-            json.dump(category_data, f, ensure_ascii=False, indent=2)
+        category_file = self.data_dir / f"{category}_{self.timestamp}.jsonl"
+        self._write_jsonl(category_file, category_data)
 
         print(f"  ✅ Saved {category}: {len(category_data)} pages → {category_file.name}")
 
-        # Remove saved data from scraped_data to free memory
-        self.scraped_data = [item for item in self.scraped_data if item.get('category') != category]
-
         # Track saved files
         self.saved_files.append(category_file)
 
-        return category_file
+        return category_file, len(category_data)
 
     def save_data(self, output_file: Optional[Path] = None):
         """
@@ -427,37 +771,29 @@ class WebCrawler:
             output_file: Optional output file path (ignored, kept for compatibility)
         """
         # If data already saved incrementally, return those files
-        if self.saved_files and not self.scraped_data:
+        if self.saved_files and not self._by_category:
             print(f"\n✅ Data already saved to {len(self.saved_files)} category files")
             return self.saved_files
 
         # Otherwise, save remaining data (backward compatibility)
-        if not self.scraped_data:
+        if not self._by_category:
             print("\n⚠️  No data to save")
             return []
 
-        # Group data by category
-        data_by_category = {}
-        for item in self.scraped_data:
-            category = item.get('category', 'unknown')
-            if category not in data_by_category:
-                data_by_category[category] = []
-            data_by_category[category].append(item)
-
         # Generate timestamp for filenames if not already set
         if self.timestamp is None:
             self.timestamp = int(time.time())
 
         # Save each category to a separate file
         saved_files = []
-        for category, items in data_by_category.items():
-            category_file = self.data_dir / f"{category}_{self.timestamp}.json"
-            with open(category_file, 'w', encoding='utf-8') as f:
-                json.dump(items, f, ensure_ascii=False, indent=2)
+        for category, items in self._by_category.items():
+            category_file = self.data_dir / f"{category}_{self.timestamp}.jsonl"
+            self._write_jsonl(category_file, items)
 
             saved_files.append(category_file)
             print(f"  📄 {category}: {len(items)} pages → {category_file.name}")
 
         print(f"\n✅ Data saved to {len(saved_files)} category files")
+        self._by_category.clear()
         self.saved_files.extend(saved_files)
         return saved_files
\ No newline at end of file
@@ -1,10 +1,15 @@
 """HTML parser for extracting content from web pages."""
 
 import re
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Pattern, Union
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 
+# Patterns used on every page, compiled once
+_CONTENT_CLASS_RE = re.compile(r'content|main|body|article', re.I)
+_CONTENT_ID_RE = re.compile(r'content|main|body|article', re.I)
+_JP_DATE_RE = re.compile(r'(\d{4})年(\d{2})月(\d{2})日')
+
 
 class HTMLParser:
     """Parser for extracting content and links from HTML."""
@@ -18,6 +23,18 @@ class HTMLParser:
         """
         self.base_url = base_url
 
+    def parse(self, html: str) -> BeautifulSoup:
+        """
+        Parse HTML into a tree that can be shared by the extractors.
+
+        Args:
+            html: The HTML content
+
+        Returns:
+            Parsed BeautifulSoup object
+        """
+        return BeautifulSoup(html, 'lxml')
+
     def extract_content(self, html: str, url: str) -> Dict:
         """
         Extract text content and metadata from HTML.
@@ -29,8 +46,22 @@ class HTMLParser:
         Returns:
             Dictionary containing extracted content and metadata
         """
-        soup = BeautifulSoup(html, 'lxml')
+        return self.extract_content_from_soup(self.parse(html), url)
+
+    def extract_content_from_soup(self, soup: BeautifulSoup, url: str) -> Dict:
+        """
+        Extract text content and metadata from an already parsed page.
+
+        Script and style elements are removed from the tree in place; links
+        can still be extracted from it afterwards.
 
+        Args:
+            soup: Parsed BeautifulSoup object
+            url: The URL of the page
+
+        Returns:
+            Dictionary containing extracted content and metadata
+        """
         # Remove script and style elements
         for element in soup(['script', 'style', 'noscript', 'iframe']):
             element.decompose()
@@ -74,45 +105,99 @@ class HTMLParser:
         Returns:
             List of absolute URLs for internal links
         """
-        soup = BeautifulSoup(html, 'lxml')
+        return self.extract_links_from_soup(self.parse(html), current_url)
+
+    def extract_links_from_soup(self, soup: BeautifulSoup, current_url: str) -> List[str]:
+        """
+        Extract all internal links from an already parsed page.
+
+        Args:
+            soup: Parsed BeautifulSoup object
+            current_url: The current page URL
+
+        Returns:
+            List of absolute URLs for internal links
+        """
+        # Resolve relative links against <base href> when the page declares one
+        base_tag = soup.find('base', href=True)
+        if base_tag:
+            current_url = urljoin(current_url, base_tag['href'])
+
+        seen = set()
         links = []
 
         for tag in soup.find_all('a', href=True):
             href = tag['href']
 
-            # Skip empty links, anchors, and external links
-            if not href or href.startswith('#') or href.startswith('javascript:'):
+            # Skip empty links, anchors, scripts and mail links
+            if not href or href.startswith(('#', 'javascript:', 'mailto:')):
                 continue
 
             # Convert to absolute URL
             absolute_url = urljoin(current_url, href)
 
-            # Only include links within the same domain
-            if self._is_same_domain(absolute_url, self.base_url):
+            # Only include links within the same domain, keeping first-seen order
+            if absolute_url not in seen and self._is_same_domain(absolute_url, self.base_url):
+                seen.add(absolute_url)
                 links.append(absolute_url)
 
-        return list(set(links))  # Remove duplicates
+        return links
 
-    def extract_subpage_links(self, html: str, current_url: str, pattern: Optional[str] = None) -> List[str]:
+    def extract_subpage_links(
+        self,
+        html: str,
+        current_url: str,
+        pattern: Optional[Union[str, Pattern]] = None
+    ) -> List[str]:
         """
         Extract specific subpage links (e.g., for column details).
 
         Args:
             html: The HTML content
             current_url: The current page URL
-            pattern: Optional regex pattern to filter links
+            pattern: Optional regex pattern (string or compiled) to filter links
+
+        Returns:
+            List of matching subpage URLs
+        """
+        return self.extract_subpage_links_from_soup(self.parse(html), current_url, pattern)
+
+    def extract_subpage_links_from_soup(
+        self,
+        soup: BeautifulSoup,
+        current_url: str,
+        pattern: Optional[Union[str, Pattern]] = None
+    ) -> List[str]:
+        """
+        Extract specific subpage links from an already parsed page.
+
+        Args:
+            soup: Parsed BeautifulSoup object
+            current_url: The current page URL
+            pattern: Optional regex pattern (string or compiled) to filter links
 
         Returns:
             List of matching subpage URLs
         """
-        all_links = self.extract_links(html, current_url)
+        return self.filter_links(self.extract_links_from_soup(soup, current_url), pattern)
+
+    def filter_links(self, links: List[str], pattern: Optional[Union[str, Pattern]] = None) -> List[str]:
+        """
+        Filter already extracted links by a regex pattern.
+
+        Args:
+            links: List of absolute URLs
+            pattern: Optional regex pattern (string or compiled) to filter links
 
+        Returns:
+            List of matching URLs (all links if no pattern is given)
+        """
         if pattern:
-            # Filter links by pattern
+            # Filter links by pattern (compiled patterns are returned unchanged)
             pattern_regex = re.compile(pattern)
-            return [link for link in all_links if pattern_regex.search(link)]
+            return [link for link in links if pattern_regex.search(link)]
 
-        return all_links
+        return links
 
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract page title."""
@@ -163,7 +248,7 @@ class HTMLParser:
             time_text = time_tag.get_text(strip=True)
             if time_text:
                 # Try to parse Japanese date format: 2014年06月05日
-                match = re.search(r'(\d{4})年(\d{2})月(\d{2})日', time_text)
+                match = _JP_DATE_RE.search(time_text)
                 if match:
                     year, month, day = match.groups()
                     return f"{year}-{month}-{day}"
@@ -192,8 +277,8 @@ class HTMLParser:
         content_selectors = [
             {'name': 'main'},
             {'name': 'article'},
-            {'name': 'div', 'class': re.compile(r'content|main|body|article', re.I)},
-            {'name': 'div', 'id': re.compile(r'content|main|body|article', re.I)},
+            {'name': 'div', 'class': _CONTENT_CLASS_RE},
+            {'name': 'div', 'id': _CONTENT_ID_RE},
         ]
 
         for selector in content_selectors:
@@ -216,16 +301,9 @@ class HTMLParser:
         if not text:
             return ""
 
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-
-        # Remove leading/trailing whitespace
-        text = text.strip()
-
-        # Remove multiple newlines
-        text = re.sub(r'\n+', '\n', text)
-
-        return text
+        # Collapse all whitespace (including newlines) to single spaces and trim;
+        # str.split() uses the same Unicode whitespace set as \s, in C
+        return ' '.join(text.split())
 
     def _is_same_domain(self, url: str, base_url: str) -> bool:
         """Check if URL is from the same domain as base URL."""
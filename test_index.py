@@ -3,8 +3,8 @@
 Test indexing a small subset of documents.
 """
 
-import json
 import sys
+from itertools import islice
 from pathlib import Path
 
 # Add project root to path
@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from config import DEFAULT_RAG_CONFIG
 from rag import DocumentIndexer
+from rag.indexer import iter_scraped_data
 
 
 def test_indexing():
@@ -19,13 +20,9 @@ def test_indexing():
     print("Testing RAGLite indexing...")
     print("-" * 40)
 
-    # Load scraped data
+    # Load only the first 5 documents for testing (read lazily from .jsonl dumps)
     json_file = Path("data/raw/scraped_data_1759602591.json")
-    with open(json_file, 'r', encoding='utf-8') as f:
-        scraped_data = json.load(f)
-
-    # Use only first 5 documents for testing
-    test_data = scraped_data[:5]
+    test_data = list(islice(iter_scraped_data(json_file), 5))
     print(f"Testing with {len(test_data)} documents")
 
     # Initialize indexer
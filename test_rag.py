@@ -95,7 +95,8 @@ def check_environment():
     data_dir = Path("data")
     raw_dir = data_dir / "raw"
     if raw_dir.exists():
-        json_files = list(raw_dir.glob("*.json"))
+        # The crawler writes JSON Lines; older runs may have left plain .json files
+        json_files = list(raw_dir.glob("*.jsonl")) + list(raw_dir.glob("*.json"))
         print(f"✅ Raw data directory: {len(json_files)} JSONファイル")
     else:
         print("⚠️ Raw data directory: 存在しません")
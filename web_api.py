@@ -1,14 +1,21 @@
 """FastAPI web server for Takaichi RAG chat interface."""
 
+import asyncio
+import logging
 import sys
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncGenerator
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse, FileResponse
+from typing import AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple, Union
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from dotenv import load_dotenv
-import json
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
+import numpy as np
+import orjson
 
 # Load environment variables
 load_dotenv()
@@ -16,14 +23,24 @@ load_dotenv()
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import DEFAULT_RAG_CONFIG
-from rag import QueryEngine
+from config import DB_URL, RAG_RERANK_ENABLED, RAG_SSE_METRICS, RAG_TOP_K, get_default_config
+from rag import QueryEngine, SemanticCache
+from rag.query import batch_tokens, normalize_question
+from rag.setup import get_async_http_client
+
+logger = logging.getLogger(__name__)
+
+
+# Document metadata fields that chat requests may filter on
+FILTER_FIELDS = ('category', 'url', 'title')
 
 
 # Request/Response models
 class ChatRequest(BaseModel):
     message: str
-    num_chunks: int = 5
+    num_chunks: int = RAG_TOP_K
+    # e.g. {"category": "column"}; a list of values matches any of them
+    filters: Optional[Dict[str, Union[str, List[str]]]] = None
 
 
 class HealthResponse(BaseModel):
@@ -31,11 +48,127 @@ class HealthResponse(BaseModel):
     version: str
 
 
+class InflightAnswer:
+    """
+    Answer being generated for a question, shared by concurrent identical requests.
+
+    Answer pieces are buffered as they arrive, so requests that join late are
+    re-fed from the start and then follow the live stream.
+    """
+
+    def __init__(self):
+        """Initialize an empty answer."""
+        self.pieces: List[str] = []
+        self.result: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.task = None
+        self.timings: Dict[str, float] = {}
+        self._updated = asyncio.Event()
+
+    def _notify(self):
+        """Wake up every subscriber waiting for new pieces."""
+        updated, self._updated = self._updated, asyncio.Event()
+        updated.set()
+
+    def append(self, piece: str):
+        """Add an answer piece."""
+        self.pieces.append(piece)
+        self._notify()
+
+    def finish(self, result: Dict):
+        """Complete the answer with its final result."""
+        self.result.set_result(result)
+        self._notify()
+
+    def fail(self, error: Exception):
+        """
+        Complete the answer with an error.
+
+        The caller logs the error; it is marked as retrieved here so asyncio
+        does not report it again when every subscriber has already left.
+        """
+        self.result.set_exception(error)
+        self.result.exception()
+        self._notify()
+
+    async def stream(self) -> AsyncIterator[str]:
+        """
+        Yield every answer piece from the start until the answer is complete.
+
+        Yields:
+            Answer pieces in order
+        """
+        sent = 0
+        while True:
+            while sent < len(self.pieces):
+                yield self.pieces[sent]
+                sent += 1
+            if self.result.done():
+                return
+            await self._updated.wait()
+
+
+# Answers currently being generated, keyed by normalized question, chunk count and filters
+_inflight: Dict[Tuple[str, int, str], InflightAnswer] = {}
+
+# Rolling latency samples (ms) for each phase of /api/chat
+_latencies: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+
+
+def record_timing(timings: Dict[str, float], phase: str, start: float) -> float:
+    """
+    Record the time elapsed since start for a chat phase.
+
+    Args:
+        timings: Per-request timings to add the phase to
+        phase: Phase name (embed, retrieve, llm, stream, total)
+        start: Start time from time.perf_counter()
+
+    Returns:
+        Current time from time.perf_counter(), to start the next phase
+    """
+    now = time.perf_counter()
+    elapsed_ms = (now - start) * 1000
+    timings[f"{phase}_ms"] = round(elapsed_ms, 1)
+    _latencies[phase].append(elapsed_ms)
+    return now
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the query engine at startup and warm it up before serving requests.
+
+    Args:
+        app: The FastAPI application
+    """
+    # The reranker model is only loaded when reranking is enabled; the
+    # database is tuned as part of building the configuration
+    config = await asyncio.to_thread(get_default_config, RAG_RERANK_ENABLED)
+
+    app.state.query_engine = await asyncio.to_thread(QueryEngine, config, RAG_RERANK_ENABLED)
+
+    # Answers to earlier questions, reused for paraphrases without calling the LLM
+    app.state.semantic_cache = SemanticCache(threshold=0.88, maxsize=2048)
+
+    # A throwaway retrieval opens the embedding API connection and loads the
+    # database indexes, so the first real request does not pay for it
+    try:
+        await app.state.query_engine.aretrieve("warmup", num_chunks=1)
+    except Exception as e:
+        print(f"⚠️  ウォームアップに失敗しました: {e}")
+
+    yield
+
+    app.state.query_engine.close()
+    await get_async_http_client().aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="たかいち RAG Chat API",
     description="たかいちRAGシステムのWebチャットインターフェース",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Mount static files
@@ -43,8 +176,20 @@ static_dir = Path(__file__).parent / "static"
 static_dir.mkdir(exist_ok=True)
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
-# Initialize query engine
-query_engine = QueryEngine(DEFAULT_RAG_CONFIG)
+
+def sse_event(event: str, data: Optional[str] = None) -> ServerSentEvent:
+    """
+    Build an SSE frame whose type is carried by the SSE event field.
+
+    Args:
+        event: Event type (answer, answer_end, sources, done, error)
+        data: Raw text payload, if any (multi-line text becomes several data lines)
+
+    Returns:
+        Server-sent event
+    """
+    # LF-only separators keep frames one byte per line smaller than CRLF
+    return ServerSentEvent(data=data, event=event, sep="\n")
 
 
 @app.get("/", response_class=FileResponse)
@@ -62,88 +207,171 @@ async def health_check():
     return HealthResponse(status="healthy", version="1.0.0")
 
 
+@app.get("/api/metrics")
+async def metrics():
+    """Rolling p50/p95/p99 latencies (ms) of each /api/chat phase over the last 1000 samples."""
+    phases = {}
+    for phase, samples in list(_latencies.items()):
+        if samples:
+            p50, p95, p99 = np.percentile(np.fromiter(samples, dtype=np.float64), [50, 95, 99])
+            phases[phase] = {
+                'count': len(samples),
+                'p50': round(float(p50), 1),
+                'p95': round(float(p95), 1),
+                'p99': round(float(p99), 1)
+            }
+    return {'chat': phases}
+
+
 @app.post("/api/chat")
-async def chat_stream(request: ChatRequest):
+async def chat_stream(request: ChatRequest, http_request: Request):
     """
     Stream chat responses with sources.
 
     Returns Server-Sent Events (SSE) stream with:
-    - answer chunks (streaming)
-    - sources (after answer completion)
+    - answer events carrying raw answer text (streamed as the LLM generates it)
+    - one sources event carrying the source previews as JSON (after answer completion)
     """
-    if not request.message.strip():
+    question = request.message.strip()
+    if not question:
         raise HTTPException(status_code=400, detail="Message cannot be empty")
 
-    async def generate_response() -> AsyncGenerator[str, None]:
-        try:
-            # Get answer with sources
-            result = query_engine.query_with_sources(
-                question=request.message,
-                num_chunks=request.num_chunks
+    filters = request.filters or None
+    if filters:
+        unknown = sorted(set(filters) - set(FILTER_FIELDS))
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown filter fields: {', '.join(unknown)} (allowed: {', '.join(FILTER_FIELDS)})"
             )
+    # Canonical form of the filters, so equal filters share cache entries
+    filter_key = orjson.dumps(filters, option=orjson.OPT_SORT_KEYS).decode() if filters else ''
+
+    query_engine = http_request.app.state.query_engine
+    semantic_cache = http_request.app.state.semantic_cache
+    key = (normalize_question(question), request.num_chunks, filter_key)
 
-            # Stream answer character by character for better UX
-            answer = result["answer"]
-            for i in range(0, len(answer), 10):  # Send in chunks of 10 chars
-                chunk = answer[i:i+10]
-                # Ensure proper JSON encoding with ensure_ascii=False for Japanese
-                data = json.dumps({'type': 'answer', 'content': chunk}, ensure_ascii=False)
-                yield f"data: {data}\n\n"
+    async def generate_answer(inflight: InflightAnswer, embedding):
+        """Generate the answer into the shared buffer, independent of any one client."""
+        timings = inflight.timings
+        try:
+            # Retrieve first, then forward tokens as the LLM produces them,
+            # batched (8 tokens or 25 ms) to cut per-frame overhead
+            start = time.perf_counter()
+            # Metadata filters restrict both searches before ranking
+            sources, tokens = await query_engine.stream_with_sources(
+                question, request.num_chunks, metadata_filter=filters
+            )
+            start = record_timing(timings, 'retrieve', start)
+            async for piece in batch_tokens(tokens, max_tokens=8, max_delay=0.025):
+                if not inflight.pieces:
+                    # Time to first answer piece
+                    start = record_timing(timings, 'llm', start)
+                inflight.append(piece)
+            record_timing(timings, 'stream', start)
+
+            result = {
+                'question': question,
+                'answer': "".join(inflight.pieces),
+                'sources': sources,
+                'num_sources': len(sources)
+            }
+            semantic_cache.put(
+                embedding,
+                {'num_chunks': request.num_chunks, 'filters': filter_key, 'result': result}
+            )
+            inflight.finish(result)
+        except Exception as e:
+            logger.exception("Answer generation failed for %r", question)
+            inflight.fail(e)
+        finally:
+            _inflight.pop(key, None)
+
+    async def generate_response() -> AsyncGenerator[ServerSentEvent, None]:
+        timings = {}
+        request_start = time.perf_counter()
+        try:
+            # Identical questions already being answered share that answer
+            inflight = _inflight.get(key)
+
+            if inflight is None:
+                # Paraphrases of earlier questions are answered from the semantic cache
+                embedding = await query_engine.aembed(question)
+                record_timing(timings, 'embed', request_start)
+                cached = semantic_cache.get(embedding)
+
+                if (cached is not None and cached['num_chunks'] == request.num_chunks
+                        and cached['filters'] == filter_key):
+                    result = cached['result']
+                    yield sse_event('answer', result['answer'])
+                else:
+                    # Another request may have started the same question meanwhile
+                    inflight = _inflight.get(key)
+                    if inflight is None:
+                        inflight = InflightAnswer()
+                        _inflight[key] = inflight
+                        inflight.task = asyncio.create_task(generate_answer(inflight, embedding))
+
+            if inflight is not None:
+                async for piece in inflight.stream():
+                    yield sse_event('answer', piece)
+                result = inflight.result.result()
+                timings.update(inflight.timings)
 
             # Send end of answer marker
-            yield f"data: {json.dumps({'type': 'answer_end'})}\n\n"
+            yield sse_event('answer_end')
 
-            # Send sources one by one to avoid huge JSON payloads
             if result["sources"]:
-                for source in result["sources"]:
-                    # Create a clean copy of source with truncated content for preview
-                    source_preview = {
+                # Clean copies of the sources with content truncated to 300 chars for preview
+                source_previews = [
+                    {
                         'index': source['index'],
                         'title': source['title'],
                         'category': source['category'],
                         'url': source['url'],
-                        # Truncate content to avoid huge payloads and keep first 300 chars
                         'content': source['content'][:300] + ('...' if len(source['content']) > 300 else '')
                     }
-                    # Ensure proper JSON encoding with separators to avoid extra whitespace
-                    data = json.dumps(
-                        {'type': 'source', 'content': source_preview},
-                        ensure_ascii=False,
-                        separators=(',', ':')
-                    )
-                    yield f"data: {data}\n\n"
+                    for source in result["sources"]
+                ]
+                # orjson emits compact UTF-8 JSON (no ASCII escaping of Japanese text)
+                yield sse_event('sources', orjson.dumps(source_previews).decode())
 
-                # Send sources end marker
-                yield f"data: {json.dumps({'type': 'sources_end'})}\n\n"
+            record_timing(timings, 'total', request_start)
+            if RAG_SSE_METRICS:
+                yield sse_event('metrics', orjson.dumps(timings).decode())
 
             # Send completion marker
-            yield f"data: {json.dumps({'type': 'done'})}\n\n"
+            yield sse_event('done')
 
         except Exception as e:
             error_msg = f"エラーが発生しました: {str(e)}"
-            yield f"data: {json.dumps({'type': 'error', 'content': error_msg}, ensure_ascii=False)}\n\n"
+            yield sse_event('error', error_msg)
 
-    return StreamingResponse(
+    # EventSourceResponse handles framing and keep-alive pings
+    return EventSourceResponse(
         generate_response(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
+        headers={"X-Accel-Buffering": "no"},
+        sep="\n"
     )
 
 
-def run_server(host: str = "0.0.0.0", port: int = 8000):
+def run_server(host: str = "0.0.0.0", port: int = 8000, workers: int = 1):
     """
     Run the web server.
 
     Args:
         host: Host address to bind to
         port: Port number to listen on
+        workers: Number of worker processes (more than one requires a PostgreSQL DB_URL)
     """
     import uvicorn
 
+    # DuckDB locks its database file to a single process, so extra workers
+    # could not open it; each worker would also build its own engine and caches
+    if workers > 1 and DB_URL.startswith("duckdb"):
+        print("⚠️  DuckDBは複数プロセスから同時に開けないため、ワーカー数を1にします")
+        workers = 1
+
     print("=" * 50)
     print("たかいち RAG Webチャットサーバー")
     print("=" * 50)
@@ -152,7 +380,18 @@ def run_server(host: str = "0.0.0.0", port: int = 8000):
     print("\n⚠️  免責事項: 本システムは非公式の研究プロジェクトであり、特定の政治家や組織とは一切関係ありません")
     print("Ctrl+C でサーバーを停止\n")
 
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # uvloop and httptools (from uvicorn[standard]) cut per-frame overhead on SSE;
+    # "auto" falls back to asyncio/h11 where they are unavailable.
+    # Multiple workers need an import string so each process can load the app.
+    uvicorn.run(
+        "web_api:app" if workers > 1 else app,
+        host=host,
+        port=port,
+        workers=workers,
+        log_level="info",
+        loop="auto",
+        http="auto"
+    )
 
 
 if __name__ == "__main__":